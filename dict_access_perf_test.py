@@ -1,7 +1,7 @@
 """
 What is the most efficient way to access dictionary value by key for best algorithmic performance?
 
-Simple perf test with random strings as values and int as keys
+Simple perf test with random floats as values and int as keys
 
 Performance results:
 
@@ -33,91 +33,81 @@ Approach                         Total time         Per iteration
 - dict.setdefault(key, default)     0.066943s            0.000067s
 - using defaultdict                 0.052413s            0.000052s
 """
+import operator
+import platform
 import random
+import sys
 import timeit
 from collections import defaultdict
 
+import numpy as np
+
 PERF_ITERATIONS = 1000
 DICTIONARY_SIZE = 1000
 TYPE = "rand_keys"
 
+# random factors are drawn in one batch per call, so the loops time dictionary access rather than the RNG
+RNG = np.random.default_rng(0)
+# the fixture is built from a private stdlib generator instead of reseeding the module-global one
+PY_RNG = random.Random(0)
+
 
 def random_value(data_type, seed=None):
     if seed is not None:
-        random.seed(seed)
+        PY_RNG.seed(seed)
     if data_type == int:
-        return random.randint(-100, 100)
+        return PY_RNG.randint(-100, 100)
     elif data_type == float:
-        return random.uniform(-100.0, 100.0)
+        return PY_RNG.uniform(-100.0, 100.0)
     elif data_type == str:
-        length = random.randint(1, 10)
-        return "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=length))
+        length = PY_RNG.randint(1, 10)
+        return "".join(PY_RNG.choices("abcdefghijklmnopqrstuvwxyz", k=length))
     elif data_type == list:
-        length = random.randint(0, 10)
+        length = PY_RNG.randint(0, 10)
         return [random_value(type, seed) for i in range(length)]
     elif data_type == tuple:
-        length = random.randint(0, 10)
+        length = PY_RNG.randint(0, 10)
         return tuple(random_value(type, seed) for i in range(length))
     elif data_type == dict:
-        length = random.randint(0, 10)
+        length = PY_RNG.randint(0, 10)
         return {random_value(str, seed): random_value(type, seed) for i in range(length)}
     else:
         raise ValueError("Unsupported data type")
 
 
-def dict_iteration(method, n=DICTIONARY_SIZE):
-    """
-    Iterate over a range of integer keys of size n
-
-    Parameters:
-    - method: str, one of 'seq_keys', 'rand_keys'
-    - n: size of integers
+# materialize the key orders once, so the timed methods don't rebuild and reshuffle them on every call
+SEQ_KEYS = list(range(DICTIONARY_SIZE))
+RAND_KEYS = list(range(DICTIONARY_SIZE))
+PY_RNG.shuffle(RAND_KEYS)
 
-    Yields:
-    - key: key of the next item in the dictionary
-    """
-
-    if method == "seq_keys":
-        for key in range(n):
-            yield key
-    elif method == "rand_keys":
-        keys = list(range(n))
-        random.shuffle(keys)
-        for key in keys:
-            yield key
-    else:
-        raise ValueError("Unsupported method")
+if TYPE == "seq_keys":
+    KEY_ITER = SEQ_KEYS
+elif TYPE == "rand_keys":
+    KEY_ITER = RAND_KEYS
+else:
+    raise ValueError("Unsupported key order")
 
 
 # create a dictionary with random keys and values
-d = {i: random_value(str, seed=i) for i in range(DICTIONARY_SIZE)}
+d = {i: random_value(float, seed=i) for i in range(DICTIONARY_SIZE)}
 
 
 # method 1: using dict[key]
 def method1():
-    llist = []
-    for key in dict_iteration(TYPE):
-        x = d[key]
-        v = random.random() * x
-        llist.append(v)
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * d[key] for factor, key in zip(factors, KEY_ITER)]
 
 
 # method 2: using dict.get(key)
 def method2():
-    llist = []
-    for key in dict_iteration(TYPE):
-        x = d.get(key)
-        v = random.random() * x
-        llist.append(v)
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * d.get(key) for factor, key in zip(factors, KEY_ITER)]
 
 
 # method 3: using dict.setdefault(key, default)
 def method3():
-    llist = []
-    for key in dict_iteration(TYPE):
-        x = d.setdefault(key, 0)
-        v = random.random() * x
-        llist.append(v)
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * d.setdefault(key, 0) for factor, key in zip(factors, KEY_ITER)]
 
 
 # method 4: using defaultdict
@@ -126,21 +116,58 @@ dd.update(d)
 
 
 def method4():
-    llist = []
-    for key in dict_iteration(TYPE):
-        x = dd[key]
-        v = random.random() * x
-        llist.append(v)
-
-
-# measure the time taken by each method
-t1 = timeit.timeit(method1, number=PERF_ITERATIONS)
-t2 = timeit.timeit(method2, number=PERF_ITERATIONS)
-t3 = timeit.timeit(method3, number=PERF_ITERATIONS)
-t4 = timeit.timeit(method4, number=PERF_ITERATIONS)
-
-# print the results
-print(f"Using dict[key]: {t1:.6f} seconds and per iteration {t1 / PERF_ITERATIONS:.6f}")
-print(f"Using dict.get(key): {t2:.6f} seconds and per iteration {t2 / PERF_ITERATIONS:.6f}")
-print(f"Using dict.setdefault(key, default): {t3:.6f} seconds and per iteration {t3 / PERF_ITERATIONS:.6f}")
-print(f"Using defaultdict: {t4:.6f} seconds and per iteration {t4 / PERF_ITERATIONS:.6f}")
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * dd[key] for factor, key in zip(factors, KEY_ITER)]
+
+
+# method 5: using numpy array gather (NON-STDLIB)
+# keys are 0..n-1, so the dictionary maps directly onto array positions
+d_arr = np.array([d[i] for i in range(DICTIONARY_SIZE)], dtype=np.float64)
+KEY_ARR = np.array(KEY_ITER, dtype=np.int64)
+
+
+def method5():
+    return RNG.random(len(KEY_ARR)) * d_arr[KEY_ARR]
+
+
+# method 6: using map() over the bound dict.__getitem__
+def method6():
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * x for factor, x in zip(factors, map(d.__getitem__, KEY_ITER))]
+
+
+# method 7: using operator.itemgetter to fetch all keys in a single call
+# (with one key itemgetter returns the bare value instead of a tuple, so DICTIONARY_SIZE must be > 1)
+get_all = operator.itemgetter(*KEY_ITER)
+
+
+def method7():
+    factors = RNG.random(DICTIONARY_SIZE).tolist()
+    return [factor * x for factor, x in zip(factors, get_all(d))]
+
+
+if __name__ == "__main__":
+    print(f"Interpreter: {platform.python_implementation()} {platform.python_version()}")
+    if platform.python_implementation() == "CPython":
+        if sys.version_info >= (3, 13):
+            print("Pure-Python loops are interpreter-bound, compare with PyPy or a --enable-experimental-jit build")
+        else:
+            print("Pure-Python loops are interpreter-bound, compare with PyPy for a JIT-compiled run")
+
+    # measure the time taken by each method
+    t1 = timeit.timeit(method1, number=PERF_ITERATIONS)
+    t2 = timeit.timeit(method2, number=PERF_ITERATIONS)
+    t3 = timeit.timeit(method3, number=PERF_ITERATIONS)
+    t4 = timeit.timeit(method4, number=PERF_ITERATIONS)
+    t5 = timeit.timeit(method5, number=PERF_ITERATIONS)
+    t6 = timeit.timeit(method6, number=PERF_ITERATIONS)
+    t7 = timeit.timeit(method7, number=PERF_ITERATIONS)
+
+    # print the results
+    print(f"Using dict[key]: {t1:.6f} seconds and per iteration {t1 / PERF_ITERATIONS:.6f}")
+    print(f"Using dict.get(key): {t2:.6f} seconds and per iteration {t2 / PERF_ITERATIONS:.6f}")
+    print(f"Using dict.setdefault(key, default): {t3:.6f} seconds and per iteration {t3 / PERF_ITERATIONS:.6f}")
+    print(f"Using defaultdict: {t4:.6f} seconds and per iteration {t4 / PERF_ITERATIONS:.6f}")
+    print(f"Using numpy array gather: {t5:.6f} seconds and per iteration {t5 / PERF_ITERATIONS:.6f}")
+    print(f"Using map(dict.__getitem__): {t6:.6f} seconds and per iteration {t6 / PERF_ITERATIONS:.6f}")
+    print(f"Using operator.itemgetter: {t7:.6f} seconds and per iteration {t7 / PERF_ITERATIONS:.6f}")
@@ -15,6 +15,7 @@ Approach                         Total time    Per iteration
 - numpy ndarray (NON-STDLIB)     28.0520s            0.2805s
 
 """
+import numba
 import numpy as np
 
 LIMIT = 500
@@ -34,9 +35,13 @@ def perf_test():
                 current_board[i][j] = 0
 
 
-def perf_test2():
+def perf_test2_quadratic_scan():
     """Accessing 2d array with iterating over and getting needed index using
-    .index() function"""
+    .index() function
+
+    ANTIPATTERN: every .index() call is a linear scan, so the whole fill is O(N^4) instead of O(N^2)
+    (it also finds the first equal value rather than the current position)
+    """
     current_board = [[0 for _ in range(ARRAY_SIZE)] for _ in range(ARRAY_SIZE)]
     for row in current_board:
         for cell in row:
@@ -45,6 +50,17 @@ def perf_test2():
                 current_board[current_board.index(row)][row.index(cell)] = 0
 
 
+def perf_test2_fixed():
+    """Accessing 2d array with iterating over and getting needed index using
+    enumerate() function instead of .index()"""
+    current_board = [[0 for _ in range(ARRAY_SIZE)] for _ in range(ARRAY_SIZE)]
+    for idx, row in enumerate(current_board):
+        for jdx, _ in enumerate(row):
+            row[jdx] = idx * jdx
+            if row[jdx] > LIMIT:
+                row[jdx] = 0
+
+
 def perf_test3():
     """Accessing 2d array with enumerate() function"""
     current_board = [[0 for _ in range(ARRAY_SIZE)] for _ in range(ARRAY_SIZE)]
@@ -75,11 +91,59 @@ def perf_test5():
                 current_board[idx][jdx] = 0
 
 
+def perf_test6():
+    """Filling 2d array with numpy vectorised outer product"""
+    indices = np.arange(ARRAY_SIZE, dtype=np.int32)
+    current_board = np.multiply.outer(indices, indices)
+    np.putmask(current_board, current_board > LIMIT, 0)
+
+
+@numba.njit(parallel=True, cache=True)
+def fill_board_numba(board):
+    for i in numba.prange(board.shape[0]):
+        for j in range(board.shape[1]):
+            value = i * j
+            board[i, j] = 0 if value > LIMIT else value
+
+
+NUMBA_BOARD = np.zeros((ARRAY_SIZE, ARRAY_SIZE), dtype=np.int32)
+
+
+def perf_test7():
+    """Filling 2d array with numba compiled kernel, rows split across threads with prange"""
+    fill_board_numba(NUMBA_BOARD)
+
+
+def perf_test8():
+    """Mimicking 2d array with flat numpy buffer, row/column derived from the flat index"""
+    flat_idx = np.arange(ARRAY_SIZE * ARRAY_SIZE, dtype=np.int32)
+    i = flat_idx // ARRAY_SIZE
+    j = flat_idx - i * ARRAY_SIZE
+    current_board = i * j
+    np.putmask(current_board, current_board > LIMIT, 0)
+
+
 if __name__ == "__main__":
+    import platform
+    import sys
     import timeit
 
-    print(timeit.timeit(stmt="perf_test()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test2()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test3()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test4()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test5()", number=PERF_ITERATIONS, globals=globals()))
+    print(f"Interpreter: {platform.python_implementation()} {platform.python_version()}")
+    if platform.python_implementation() == "CPython":
+        if sys.version_info >= (3, 13):
+            print("Pure-Python loops are interpreter-bound, compare with PyPy or a --enable-experimental-jit build")
+        else:
+            print("Pure-Python loops are interpreter-bound, compare with PyPy for a JIT-compiled run")
+
+    print(timeit.timeit(perf_test, number=PERF_ITERATIONS))
+    # O(N^4) antipattern, kept for comparison with the enumerate() fix below
+    print(timeit.timeit(perf_test2_quadratic_scan, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test2_fixed, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test3, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test4, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test5, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test6, number=PERF_ITERATIONS))
+    # compile (or load from cache) before timing, so JIT cost is not counted
+    perf_test7()
+    print(timeit.timeit(perf_test7, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test8, number=PERF_ITERATIONS))
@@ -17,6 +17,9 @@ list comprehension                0.236000        0.00236
 pandas vectorisation             0.0000065        < 1e-7
 numpy vectorisation              0.0000041        < 1e-7
 
+NOTE: the vectorisation timings below were taken while perf_test6/perf_test7 returned before
+evaluating their expression, so they only measure an empty function call and need to be re-run
+
 2 col
 
 31.79612575000101
@@ -125,69 +128,63 @@ print(DATAFRAME.shape)
 
 PERF_ITERATIONS = 100
 
+COLUMNS = ["dst_bytes", "src_bytes", "count", "srv_count", "dst_host_count", "dst_host_srv_count", "other"]
+
 
 def perf_test():
     """Iterate over dataframe with iterrows function"""
-    total = []
-    for _, row in DATAFRAME.iterrows():
-        total.append(
-            row["dst_bytes"]
-            + row["src_bytes"]
-            + row["count"]
-            + row["srv_count"]
-            + row["dst_host_count"]
-            + row["dst_host_srv_count"]
-            + row["other"]
-        )
-    return total
+    return [
+        row["dst_bytes"]
+        + row["src_bytes"]
+        + row["count"]
+        + row["srv_count"]
+        + row["dst_host_count"]
+        + row["dst_host_srv_count"]
+        + row["other"]
+        for _, row in DATAFRAME.iterrows()
+    ]
 
 
 def perf_test2():
     """Iterate over dataframe with loc function"""
-    total = []
-    for i in range(len(DATAFRAME)):
-        total.append(
-            DATAFRAME["dst_bytes"].loc[i]
-            + DATAFRAME["src_bytes"].loc[i]
-            + DATAFRAME["count"].loc[i]
-            + DATAFRAME["srv_count"].loc[i]
-            + DATAFRAME["dst_host_count"].loc[i]
-            + DATAFRAME["dst_host_srv_count"].loc[i]
-            + DATAFRAME["other"].loc[i]
-        )
-    return total
+    return [
+        DATAFRAME["dst_bytes"].loc[i]
+        + DATAFRAME["src_bytes"].loc[i]
+        + DATAFRAME["count"].loc[i]
+        + DATAFRAME["srv_count"].loc[i]
+        + DATAFRAME["dst_host_count"].loc[i]
+        + DATAFRAME["dst_host_srv_count"].loc[i]
+        + DATAFRAME["other"].loc[i]
+        for i in range(len(DATAFRAME))
+    ]
 
 
 def perf_test3():
     """Iterate over dataframe with iloc function"""
-    total = []
-    for i in range(len(DATAFRAME)):
-        total.append(
-            DATAFRAME["dst_bytes"].iloc[i]
-            + DATAFRAME["src_bytes"].iloc[i]
-            + DATAFRAME["count"].iloc[i]
-            + DATAFRAME["srv_count"].iloc[i]
-            + DATAFRAME["dst_host_count"].iloc[i]
-            + DATAFRAME["dst_host_srv_count"].iloc[i]
-            + DATAFRAME["other"].iloc[i]
-        )
-    return total
+    return [
+        DATAFRAME["dst_bytes"].iloc[i]
+        + DATAFRAME["src_bytes"].iloc[i]
+        + DATAFRAME["count"].iloc[i]
+        + DATAFRAME["srv_count"].iloc[i]
+        + DATAFRAME["dst_host_count"].iloc[i]
+        + DATAFRAME["dst_host_srv_count"].iloc[i]
+        + DATAFRAME["other"].iloc[i]
+        for i in range(len(DATAFRAME))
+    ]
 
 
 def perf_test4():
     """Iterate over dataframe with itertuples function"""
-    total = []
-    for row in DATAFRAME.itertuples():
-        total.append(
-            row.dst_bytes
-            + row.src_bytes
-            + row.count
-            + row.srv_count
-            + row.dst_host_count
-            + row.dst_host_srv_count
-            + row.other
-        )
-    return total
+    return [
+        row.dst_bytes
+        + row.src_bytes
+        + row.count
+        + row.srv_count
+        + row.dst_host_count
+        + row.dst_host_srv_count
+        + row.other
+        for row in DATAFRAME.itertuples()
+    ]
 
 
 def perf_test5():
@@ -214,8 +211,7 @@ def perf_test6():
     """
     Pandas vectorisation
     """
-    return
-    (
+    return (
         DATAFRAME["dst_bytes"]
         + DATAFRAME["src_bytes"]
         + DATAFRAME["count"]
@@ -230,8 +226,7 @@ def perf_test7():
     """
     Numpy vectorisation
     """
-    return
-    (
+    return (
         DATAFRAME["dst_bytes"].to_numpy()
         + DATAFRAME["src_bytes"].to_numpy()
         + DATAFRAME["count"].to_numpy()
@@ -239,16 +234,45 @@ def perf_test7():
         + DATAFRAME["dst_host_count"].to_numpy()
         + DATAFRAME["dst_host_srv_count"].to_numpy()
         + DATAFRAME["other"].to_numpy()
-    ).to_list()
+    ).tolist()
+
+
+def perf_test8():
+    """
+    Numpy row-wise reduction over the selected columns
+
+    One fused sum(axis=1) instead of 6 chained additions, each allocating a full-length temporary
+    """
+    return DATAFRAME[COLUMNS].to_numpy().sum(axis=1).tolist()
+
+
+def perf_test9():
+    """
+    Iterate over dataframe with itertuples function yielding plain tuples
+
+    Only the needed columns are selected, so each row is summed positionally without namedtuple or index overhead
+    """
+    return [sum(row) for row in DATAFRAME[COLUMNS].itertuples(index=False, name=None)]
 
 
 if __name__ == "__main__":
+    import platform
+    import sys
     import timeit
 
-    print(timeit.timeit(stmt="perf_test()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test2()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test3()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test4()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test5()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test6()", number=PERF_ITERATIONS, globals=globals()))
-    print(timeit.timeit(stmt="perf_test7()", number=PERF_ITERATIONS, globals=globals()))
+    print(f"Interpreter: {platform.python_implementation()} {platform.python_version()}")
+    if platform.python_implementation() == "CPython":
+        if sys.version_info >= (3, 13):
+            print("Pure-Python loops are interpreter-bound, compare with PyPy or a --enable-experimental-jit build")
+        else:
+            print("Pure-Python loops are interpreter-bound, compare with PyPy for a JIT-compiled run")
+
+    print(timeit.timeit(perf_test, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test2, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test3, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test4, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test5, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test6, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test7, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test8, number=PERF_ITERATIONS))
+    print(timeit.timeit(perf_test9, number=PERF_ITERATIONS))